@@ -0,0 +1,7 @@
+import re
+
+# Characters that cannot appear in an Overpass QL set name
+INVALID_SET_CHARS_RE = re.compile(r'[\[\]{}();]')
+
+# Loose ISO 8601 check: a 'T' date/time separator followed by a 'Z' UTC designator
+ISO8601_RE = re.compile(r'T.*Z', re.DOTALL)
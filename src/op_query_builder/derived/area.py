@@ -88,11 +88,11 @@ class Area(Element):
         self._update_or_append_tag("name", name)
         return self
 
-    def __str__(self) -> str:
-        """Generate the Overpass QL query string for this Area object.
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Area object, without the trailing semicolon.
 
         Returns:
-            str: The Overpass QL query string.
+            str: The Overpass QL statement.
         """
         query = ""
         if self.filter_from_set:
@@ -116,5 +116,4 @@ class Area(Element):
         query = self._append_if_conditions(query)
         if self._store_as_set_name:
             query += f"->.{self._store_as_set_name}"
-        query += ";"
         return query
\ No newline at end of file
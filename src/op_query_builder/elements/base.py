@@ -1,6 +1,8 @@
+from abc import ABC, abstractmethod
 from typing import Optional, List, Tuple as TypingTuple, Union
+from .._validators import INVALID_SET_CHARS_RE
 
-class Element:
+class Element(ABC):
     def __init__(self):
         self.id: Optional[int] = None
         self.ids: List[int] = []
@@ -51,7 +53,7 @@ class Element:
         if not ids:
             raise ValueError("ids list cannot be empty")
         for id in ids:
-            if not isinstance(id, int):
+            if type(id) is not int and not isinstance(id, int):
                 raise TypeError(f"All values in ids must be integers, got {id} of type {type(id).__name__}")
             if id < 0:
                 raise ValueError(f"All values in ids must be non-negative integers, got {id}")
@@ -76,12 +78,12 @@ class Element:
         if not isinstance(tags, list):
             raise TypeError(f"tags must be a list, got {type(tags).__name__}")
         for tag in tags:
-            if not isinstance(tag, tuple):
+            if type(tag) is not tuple and not isinstance(tag, tuple):
                 raise TypeError(f"Each tag in tags must be a tuple, got {type(tag).__name__}")
             if len(tag) != 2:
                 raise ValueError(f"Each tag in tags must be a tuple of length 2, got {tag}")
             for el in tag:
-                if not isinstance(el, str):
+                if type(el) is not str and not isinstance(el, str):
                     raise TypeError(f"Tag key and value must be strings, got {el} of type {type(el).__name__}")
         self.tags = tags
         return self
@@ -241,7 +243,7 @@ class Element:
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         self.pivot_set = set_name
         return self
@@ -263,7 +265,7 @@ class Element:
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         self.filter_from_set = set_name
         return self
@@ -285,7 +287,7 @@ class Element:
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         self._store_as_set_name = set_name
         return self
@@ -342,4 +344,20 @@ class Element:
         """Helper method to append if conditions to the query string."""
         for condition in self.if_conditions:
             query += f"[if:{condition}]"
-        return query
\ No newline at end of file
+        return query
+
+    @abstractmethod
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this element, without the trailing semicolon.
+
+        Returns:
+            str: The Overpass QL statement.
+        """
+
+    def __str__(self) -> str:
+        """Generate the Overpass QL query string for this element.
+
+        Returns:
+            str: The Overpass QL query string.
+        """
+        return self._render_bare() + ";"
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Tuple, Optional, List, Union
 from .base import Element
+from .._validators import ISO8601_RE
 
 class Changeset(Element):
     def __init__(self) -> None:
@@ -108,7 +109,7 @@ class Changeset(Element):
             raise TypeError(f"timestamp must be a string, got {type(timestamp).__name__}")
         if not timestamp.strip():
             raise ValueError("timestamp cannot be empty or whitespace")
-        if 'T' not in timestamp or 'Z' not in timestamp:
+        if ISO8601_RE.search(timestamp) is None:
             raise ValueError(f"timestamp must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got {timestamp}")
         if self._has_time_filter():
             raise ValueError("Cannot set a time filter because another time filter (time or time_range) is already set. Use only one time filter at a time.")
@@ -133,7 +134,7 @@ class Changeset(Element):
             raise TypeError(f"start_time and end_time must be strings, got start_time={type(start_time).__name__}, end_time={type(end_time).__name__}")
         if not start_time.strip() or not end_time.strip():
             raise ValueError("start_time and end_time cannot be empty or whitespace")
-        if 'T' not in start_time or 'Z' not in start_time or 'T' not in end_time or 'Z' not in end_time:
+        if ISO8601_RE.search(start_time) is None or ISO8601_RE.search(end_time) is None:
             raise ValueError(f"start_time and end_time must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got start_time={start_time}, end_time={end_time}")
         if self._has_time_filter():
             raise ValueError("Cannot set a time range filter because another time filter (time or time_range) is already set. Use only one time filter at a time.")
@@ -180,11 +181,11 @@ class Changeset(Element):
         self._update_or_append_tag("created_by", editor)
         return self
 
-    def __str__(self) -> str:
-        """Generate the Overpass QL query string for this Changeset object.
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Changeset object, without the trailing semicolon.
 
         Returns:
-            str: The Overpass QL query string.
+            str: The Overpass QL statement.
         """
         query = ""
         if self.filter_from_set:
@@ -193,7 +194,7 @@ class Changeset(Element):
         if self.id is not None:
             query += f"({self.id})"
         elif self.ids:
-            query += f"({','.join(map(str, self.ids))})"
+            query += f"({','.join([str(i) for i in self.ids])})"
         for key, value in self.tags:
             if value == "":
                 query += f"[{key}]"
@@ -210,8 +211,8 @@ class Changeset(Element):
             start_time, end_time = self.time_range
             query += f'[time>="{start_time}"][time<="{end_time}"]'
         if self.bbox:
-            query += f"({','.join(map(str, self.bbox))})"
+            south, west, north, east = self.bbox
+            query += f"({south},{west},{north},{east})"
         if self._store_as_set_name:
             query += f"->.{self._store_as_set_name}"
-        query += ";"
         return query
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Tuple, Optional
 from .base import Element
+from .._validators import INVALID_SET_CHARS_RE, ISO8601_RE
 
 class Node(Element):
     def __init__(self) -> None:
@@ -90,7 +91,7 @@ class Node(Element):
             raise TypeError(f"area_name must be a string, got {type(area_name).__name__}")
         if not area_name.strip():
             raise ValueError("area_name cannot be empty or whitespace")
-        if any(char in area_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(area_name) is not None:
             raise ValueError(f"area_name contains invalid characters for Overpass QL: {area_name}. Avoid using [], {{}}, (), or ;.")
         if self._has_spatial_filter():
             raise ValueError("Only one spatial filter (bbox, area, around) can be set at a time. Unset the current spatial filter before setting a new one.")
@@ -212,7 +213,7 @@ class Node(Element):
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         if self._has_relation_filter() or self._has_way_filter():
             raise ValueError("Cannot set a relation filter because another relation or way filter is already set. Use only one relation or way filter at a time.")
@@ -258,7 +259,7 @@ class Node(Element):
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         if self._has_way_filter() or self._has_relation_filter():
             raise ValueError("Cannot set a way filter because another way or relation filter is already set. Use only one way or relation filter at a time.")
@@ -322,8 +323,8 @@ class Node(Element):
             raise TypeError(f"timestamp must be a string, got {type(timestamp).__name__}")
         if not timestamp.strip():
             raise ValueError("timestamp cannot be empty or whitespace")
-        # Basic ISO 8601 check (could be stricter with regex)
-        if 'T' not in timestamp or 'Z' not in timestamp:
+        # Basic ISO 8601 check
+        if ISO8601_RE.search(timestamp) is None:
             raise ValueError("timestamp must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got {timestamp}")
         self.tags.append(("newer", f'"{timestamp}"'))
         return self
@@ -348,11 +349,11 @@ class Node(Element):
         self.tags.append(("version", str(version)))
         return self
     
-    def __str__(self) -> str:
-        """Generate the Overpass QL query string for this Node object.
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Node object, without the trailing semicolon.
 
         Returns:
-            str: The Overpass QL query string.
+            str: The Overpass QL statement.
         """
         query = ""
         
@@ -367,7 +368,7 @@ class Node(Element):
         if self.id is not None:
             query += f"({self.id})"
         elif self.ids:
-            query += f"({','.join(map(str, self.ids))})"
+            query += f"({','.join([str(i) for i in self.ids])})"
         
         # Pivot set
         if self.pivot_set:
@@ -397,13 +398,15 @@ class Node(Element):
         
         # Spatial filters
         if self.bbox:
-            query += f"({','.join(map(str, self.bbox))})"
+            south, west, north, east = self.bbox
+            query += f"({south},{west},{north},{east})"
         if self.area_id is not None:
             query += f"(area:{self.area_id})"
         if self.area_name:
             query += f"(area.{self.area_name})"
         if self.around_point:
-            query += f"(around:{','.join(map(str, self.around_point))})"
+            radius, lat, lon = self.around_point
+            query += f"(around:{radius},{lat},{lon})"
         if self.around_set:
             query += f"(around.{self.around_set[0]}:{self.around_set[1]})"
         
@@ -425,7 +428,4 @@ class Node(Element):
         if self._store_as_set_name:
             query += f"->.{self._store_as_set_name}"
         
-        # Terminate the query
-        query += ";"
-        
         return query
\ No newline at end of file
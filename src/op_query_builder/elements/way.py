@@ -1,5 +1,6 @@
 from typing import Tuple, Optional, List, Union
 from .base import Element
+from .._validators import INVALID_SET_CHARS_RE, ISO8601_RE
 
 class Way(Element):
     def __init__(self) -> None:
@@ -94,7 +95,7 @@ class Way(Element):
             raise TypeError(f"area_name must be a string, got {type(area_name).__name__}")
         if not area_name.strip():
             raise ValueError("area_name cannot be empty or whitespace")
-        if any(char in area_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(area_name) is not None:
             raise ValueError(f"area_name contains invalid characters for Overpass QL: {area_name}. Avoid using [], {{}}, (), or ;.")
         if self._has_spatial_filter():
             raise ValueError("Only one spatial filter (bbox, area, around) can be set at a time. Unset the current spatial filter before setting a new one.")
@@ -191,7 +192,7 @@ class Way(Element):
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         if self._has_node_filter():
             raise ValueError("Cannot set a node filter because another node filter is already set. Use only one node filter at a time.")
@@ -262,7 +263,7 @@ class Way(Element):
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         if self._has_relation_filter():
             raise ValueError("Cannot set a relation filter because another relation filter is already set. Use only one relation filter at a time.")
@@ -396,7 +397,7 @@ class Way(Element):
             raise TypeError(f"timestamp must be a string, got {type(timestamp).__name__}")
         if not timestamp.strip():
             raise ValueError("timestamp cannot be empty or whitespace")
-        if 'T' not in timestamp or 'Z' not in timestamp:
+        if ISO8601_RE.search(timestamp) is None:
             raise ValueError("timestamp must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got {timestamp}")
         self.tags.append(("newer", f'"{timestamp}"'))
         return self
@@ -421,11 +422,11 @@ class Way(Element):
         self.tags.append(("version", str(version)))
         return self
 
-    def __str__(self) -> str:
-        """Generate the Overpass QL query string for this Way object.
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Way object, without the trailing semicolon.
 
         Returns:
-            str: The Overpass QL query string.
+            str: The Overpass QL statement.
         """
         query = ""
         if self.filter_from_set:
@@ -434,7 +435,7 @@ class Way(Element):
         if self.id is not None:
             query += f"({self.id})"
         elif self.ids:
-            query += f"({','.join(map(str, self.ids))})"
+            query += f"({','.join([str(i) for i in self.ids])})"
         if self.pivot_set:
             query += f"(pivot.{self.pivot_set})"
         for key, value in self.tags:
@@ -456,13 +457,15 @@ class Way(Element):
         if self.min_nodes is not None:
             query += f"[if:count(nodes)>{self.min_nodes}]"
         if self.bbox:
-            query += f"({','.join(map(str, self.bbox))})"
+            south, west, north, east = self.bbox
+            query += f"({south},{west},{north},{east})"
         if self.area_id is not None:
             query += f"(area:{self.area_id})"
         if self.area_name:
             query += f"(area.{self.area_name})"
         if self.around_point:
-            query += f"(around:{','.join(map(str, self.around_point))})"
+            radius, lat, lon = self.around_point
+            query += f"(around:{radius},{lat},{lon})"
         if self.around_set:
             query += f"(around.{self.around_set[0]}:{self.around_set[1]})"
         if self.node is not None:
@@ -490,6 +493,4 @@ class Way(Element):
         # Store as set
         if self._store_as_set_name:
             query += f"->.{self._store_as_set_name}"
-        
-        query += ";"
         return query
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Tuple as TypingTuple, Union as TypingUnion, Optional, List
+import sys
+from typing import Tuple as TypingTuple, Union as TypingUnion, Optional, List, Iterator, Iterable
 from op_query_builder.elements.node import Node
 from op_query_builder.elements.way import Way
 from op_query_builder.elements.relation import Relation
@@ -8,8 +9,103 @@ from op_query_builder.temporal.adiff import Adiff
 from op_query_builder.temporal.timeline import Timeline
 from op_query_builder.temporal.diff import Diff
 from op_query_builder.temporal.recurse import Recurse
+from op_query_builder._validators import INVALID_SET_CHARS_RE, ISO8601_RE
+
+_NUM_TYPES = (int, float)
+# Valid option values, as ordered tuples for error messages and frozensets for membership checks
+_OUTPUTS = ('json', 'csv', 'xml')
+_OUTPUT_DETAILS = ('body', 'skel', 'geom', 'tags', 'meta', 'center')
+_SORT_ORDERS = ('qt', 'asc', 'desc')
+_OUTPUT_MODES = ('count', 'ids')
+_ELEMENT_TYPES = ('node', 'way', 'relation')
+_VALID_OUTPUTS = frozenset(_OUTPUTS)
+_VALID_OUTPUT_DETAILS = frozenset(_OUTPUT_DETAILS)
+_VALID_SORT_ORDERS = frozenset(_SORT_ORDERS)
+_VALID_OUTPUT_MODES = frozenset(_OUTPUT_MODES)
+_VALID_ELEMENT_TYPES = frozenset(_ELEMENT_TYPES)
+# Output statement prefixes, built once per detail level
+_OUT_PREFIXES = {detail: sys.intern(f"out {detail}") for detail in _OUTPUT_DETAILS}
+_RESERVED_SETTINGS = frozenset(('date', 'timeout', 'bbox', 'out'))  # Rendered from dedicated attributes
+_QUOTED_SETTINGS = frozenset(('diff',))
+
+def _render_terminated(statement: TypingUnion[Node, Way, Relation, Changeset, Area, 'Union', 'Difference', Adiff, Timeline, Diff, Recurse, str]) -> str:
+    """Render a statement with exactly one trailing semicolon appended if it lacks one.
+
+    The library's own statement classes render without their semicolon and get one appended.
+    Anything else, including subclasses that override __str__ and raw strings, goes through str().
+
+    Args:
+        statement: A statement object or a raw Overpass QL string.
+
+    Returns:
+        str: The Overpass QL statement, terminated by a semicolon.
+    """
+    if type(statement) in _BARE_RENDER_TYPES:
+        return statement._render_bare() + ';'
+    statement_str = str(statement)
+    return statement_str if statement_str.endswith(';') else statement_str + ';'
+
+def _validate_raw_statement(raw_statement: str) -> None:
+    """Validate a raw Overpass QL statement.
+
+    Args:
+        raw_statement (str): The raw statement to validate.
+
+    Raises:
+        ValueError: If raw_statement is empty or does not end with a semicolon.
+    """
+    if not raw_statement.strip():
+        raise ValueError("raw_statement cannot be empty or whitespace")
+    if not raw_statement.strip().endswith(';'):
+        raise ValueError(f"raw_statement must end with a semicolon for valid Overpass QL syntax, got {raw_statement}")
+
+def _validate_statement(statement: TypingUnion[Node, Way, Relation, Changeset, Area, 'Union', 'Difference', Adiff, Timeline, Diff, Recurse, str]) -> None:
+    """Validate a statement passed to Query.add_many.
+
+    Args:
+        statement: A statement object or a raw Overpass QL string.
+
+    Raises:
+        TypeError: If statement is neither a statement object nor a string.
+        ValueError: If statement is a raw string that is empty or does not end with a semicolon.
+    """
+    if isinstance(statement, str):
+        _validate_raw_statement(statement)
+    elif not isinstance(statement, _STATEMENT_CLASSES):
+        raise TypeError(f"Each statement must be a Node, Way, Relation, Changeset, Area, Union, Difference, Adiff, Timeline, Diff, Recurse or raw string, got {type(statement).__name__}")
+
+def _validate_bbox(bbox: TypingTuple[float, float, float, float]) -> None:
+    """Validate the bounding box coordinates.
+
+    Args:
+        bbox (Tuple[float, float, float, float]): The bounding box to validate.
+
+    Raises:
+        TypeError: If bbox is not a tuple or values are not numbers.
+        ValueError: If bbox does not have exactly 4 values or coordinates are invalid.
+    """
+    if not isinstance(bbox, tuple):
+        raise TypeError(f"Expected a tuple for bbox, got {type(bbox).__name__}")
+    if len(bbox) != 4:
+        raise ValueError(f"Bounding box must have exactly 4 values (south, west, north, east), got {len(bbox)} values: {bbox}")
+    min_lat, min_lon, max_lat, max_lon = bbox
+    # Plain ints and floats pass without a loop; anything else is checked one value at a time
+    if not (type(min_lat) in _NUM_TYPES and type(min_lon) in _NUM_TYPES
+            and type(max_lat) in _NUM_TYPES and type(max_lon) in _NUM_TYPES):
+        for i, value in enumerate(bbox):
+            if not isinstance(value, _NUM_TYPES):
+                raise TypeError(f"Element {i} of bbox must be a float or int, got {value} of type {type(value).__name__}")
+    if not (-90 <= min_lat <= max_lat <= 90):
+        raise ValueError(f"Latitude must be between -90 and 90, with min_lat <= max_lat, got min_lat={min_lat}, max_lat={max_lat}")
+    if not (-180 <= min_lon <= max_lon <= 180):
+        raise ValueError(f"Longitude must be between -180 and 180, with min_lon <= max_lon, got min_lon={min_lon}, max_lon={max_lon}")
 
 class Query:
+    __slots__ = (
+        'output', 'output_detail', 'timeout', 'date', 'global_bbox', 'statements', 'is_in_statements',
+        'foreach_statements', 'convert_statements', 'sort_order', 'limit', 'output_mode', 'settings',
+    )
+
     def __init__(self):
         self.output: str = 'json'  # json, csv, or xml
         self.output_detail: Optional[str] = 'body'  # body, skel, geom, tags, meta, center, or None
@@ -37,7 +133,7 @@ class Query:
         Raises:
             ValueError: If output is not one of 'json', 'csv', or 'xml'.
         """
-        if output not in ['json', 'csv', 'xml']:
+        if output not in _VALID_OUTPUTS:
             raise ValueError(f"Invalid output type, must be one of 'json', 'csv', or 'xml', got {output}")
         self.output = output
         return self
@@ -55,9 +151,8 @@ class Query:
             ValueError: If detail is not one of the valid options.
         """
         if detail is not None:
-            valid_details = ['body', 'skel', 'geom', 'tags', 'meta', 'center']
-            if detail not in valid_details:
-                raise ValueError(f"Invalid output_detail, must be one of {valid_details}, got {detail}")
+            if detail not in _VALID_OUTPUT_DETAILS:
+                raise ValueError(f"Invalid output_detail, must be one of {list(_OUTPUT_DETAILS)}, got {detail}")
         self.output_detail = detail
         return self
 
@@ -74,7 +169,7 @@ class Query:
             TypeError: If timeout is not an integer.
             ValueError: If timeout is not a positive integer.
         """
-        if not isinstance(timeout, int):
+        if type(timeout) is not int and not isinstance(timeout, int):
             raise TypeError(f"Timeout must be an integer, got {type(timeout).__name__}")
         if timeout <= 0:
             raise ValueError(f"Timeout must be a positive integer, got {timeout}")
@@ -98,7 +193,7 @@ class Query:
             raise TypeError(f"Date must be a string, got {type(date).__name__}")
         if not date.strip():
             raise ValueError("Date cannot be empty or whitespace")
-        if 'T' not in date or 'Z' not in date:
+        if ISO8601_RE.search(date) is None:
             raise ValueError(f"Date must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got {date}")
         self.date = date
         return self
@@ -116,7 +211,7 @@ class Query:
             TypeError: If bbox is not a tuple or values are not numbers.
             ValueError: If bbox does not have exactly 4 values or coordinates are invalid.
         """
-        self._validate_bbox(bbox)
+        _validate_bbox(bbox)
         self.global_bbox = bbox
         return self
 
@@ -132,9 +227,8 @@ class Query:
         Raises:
             ValueError: If sort_order is not one of 'qt', 'asc', or 'desc'.
         """
-        valid_sort_orders = ['qt', 'asc', 'desc']
-        if sort_order not in valid_sort_orders:
-            raise ValueError(f"Sort order must be one of {valid_sort_orders}, got {sort_order}")
+        if sort_order not in _VALID_SORT_ORDERS:
+            raise ValueError(f"Sort order must be one of {list(_SORT_ORDERS)}, got {sort_order}")
         self.sort_order = sort_order
         return self
 
@@ -151,7 +245,7 @@ class Query:
             TypeError: If limit is not an integer.
             ValueError: If limit is not a positive integer.
         """
-        if not isinstance(limit, int):
+        if type(limit) is not int and not isinstance(limit, int):
             raise TypeError(f"Limit must be an integer, got {type(limit).__name__}")
         if limit <= 0:
             raise ValueError(f"Limit must be a positive integer, got {limit}")
@@ -171,9 +265,8 @@ class Query:
             ValueError: If mode is not one of 'count' or 'ids'.
         """
         if mode is not None:
-            valid_modes = ['count', 'ids']
-            if mode not in valid_modes:
-                raise ValueError(f"Output mode must be one of {valid_modes}, got {mode}")
+            if mode not in _VALID_OUTPUT_MODES:
+                raise ValueError(f"Output mode must be one of {list(_OUTPUT_MODES)}, got {mode}")
         self.output_mode = mode
         return self
 
@@ -202,11 +295,42 @@ class Query:
             except ValueError:
                 raise ValueError(f"maxsize must be an integer, got {value}")
         elif key == "diff":
-            if 'T' not in value or 'Z' not in value:
+            if ISO8601_RE.search(value) is None:
                 raise ValueError(f"diff must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got {value}")
         self.settings[key] = value
         return self
 
+    def _add(self, statement: TypingUnion[Node, Way, Relation, Changeset, Area, Adiff, Timeline, Diff, Recurse]) -> 'Query':
+        """Append a statement to the query.
+
+        Args:
+            statement: The statement to append.
+
+        Returns:
+            Query: Self, for method chaining.
+        """
+        self.statements.append(statement)
+        return self
+
+    def add_many(self, statements: Iterable[TypingUnion[Node, Way, Relation, Changeset, Area, 'Union', 'Difference', Adiff, Timeline, Diff, Recurse, str]]) -> 'Query':
+        """Add several statements to the query at once, in order.
+
+        Args:
+            statements (Iterable[Union[Node, Way, Relation, Changeset, Area, Union, Difference, Adiff, Timeline, Diff, Recurse, str]]): The statements to add. Raw strings follow the same rules as add_raw().
+
+        Returns:
+            Query: Self, for method chaining.
+
+        Raises:
+            TypeError: If any statement is neither a statement object nor a string.
+            ValueError: If any raw string statement is empty or does not end with a semicolon.
+        """
+        statements = list(statements)
+        for statement in statements:
+            _validate_statement(statement)
+        self.statements.extend(statements)
+        return self
+
     def add_node(self, node: Node) -> 'Query':
         """Add a Node element to the query.
 
@@ -216,8 +340,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(node)
-        return self
+        return self._add(node)
 
     def add_way(self, way: Way) -> 'Query':
         """Add a Way element to the query.
@@ -228,8 +351,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(way)
-        return self
+        return self._add(way)
 
     def add_relation(self, relation: Relation) -> 'Query':
         """Add a Relation element to the query.
@@ -240,8 +362,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(relation)
-        return self
+        return self._add(relation)
 
     def add_changeset(self, changeset: Changeset) -> 'Query':
         """Add a Changeset element to the query.
@@ -252,8 +373,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(changeset)
-        return self
+        return self._add(changeset)
 
     def add_area(self, area: Area) -> 'Query':
         """Add an Area element to the query.
@@ -264,8 +384,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(area)
-        return self
+        return self._add(area)
 
     def add_union(self, *elements: TypingUnion[Node, Way, Relation, Changeset, Area]) -> 'Query':
         """Add a union of elements to the query (e.g., '(node[amenity=restaurant]; way[highway=primary];)').
@@ -282,8 +401,7 @@ class Query:
         if not elements:
             raise ValueError("At least one element must be provided for a union. Provide at least one Node, Way, Relation, Changeset, or Area.")
         union = Union(elements)
-        self.statements.append(union)
-        return self
+        return self._add(union)
 
     def add_difference(self, base: TypingUnion[Node, Way, Relation, Changeset, Area], *subtract: TypingUnion[Node, Way, Relation, Changeset, Area]) -> 'Query':
         """Add a difference operation to the query (e.g., '(node[amenity=restaurant]; - node[access=customers];)').
@@ -301,8 +419,7 @@ class Query:
         if not subtract:
             raise ValueError("At least one element must be provided to subtract in a difference. Provide at least one Node, Way, Relation, Changeset, or Area to subtract.")
         difference = Difference(base, subtract)
-        self.statements.append(difference)
-        return self
+        return self._add(difference)
 
     def add_adiff(self, adiff: Adiff) -> 'Query':
         """Add an Adiff temporal statement to the query.
@@ -313,8 +430,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(adiff)
-        return self
+        return self._add(adiff)
 
     def add_timeline(self, timeline: Timeline) -> 'Query':
         """Add a Timeline temporal statement to the query.
@@ -325,8 +441,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(timeline)
-        return self
+        return self._add(timeline)
 
     def add_diff(self, diff: Diff) -> 'Query':
         """Add a Diff temporal statement to the query.
@@ -337,8 +452,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(diff)
-        return self
+        return self._add(diff)
 
     def add_recurse(self, recurse: Recurse) -> 'Query':
         """Add a Recurse temporal statement to the query.
@@ -349,8 +463,7 @@ class Query:
         Returns:
             Query: Self, for method chaining.
         """
-        self.statements.append(recurse)
-        return self
+        return self._add(recurse)
 
     def add_is_in(self, lat: float, lon: float, set_name: Optional[str] = None) -> 'Query':
         """Add an 'is_in' statement to find areas containing the given point (e.g., 'is_in(51.5,-0.1)->.areas;').
@@ -367,7 +480,7 @@ class Query:
             TypeError: If lat or lon is not a number, or set_name is not a string.
             ValueError: If lat/lon are out of range or set_name contains invalid characters.
         """
-        if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+        if not (type(lat) in _NUM_TYPES or isinstance(lat, _NUM_TYPES)) or not (type(lon) in _NUM_TYPES or isinstance(lon, _NUM_TYPES)):
             raise TypeError(f"lat and lon must be numbers (int or float), got lat={type(lat).__name__}, lon={type(lon).__name__}")
         if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
             raise ValueError(f"lat must be between -90 and 90, lon between -180 and 180, got lat={lat}, lon={lon}")
@@ -376,7 +489,7 @@ class Query:
                 raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
             if not set_name.strip():
                 raise ValueError("set_name cannot be empty or whitespace")
-            if any(char in set_name for char in '[]{}();'):
+            if INVALID_SET_CHARS_RE.search(set_name) is not None:
                 raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         self.is_in_statements.append((lat, lon, set_name))
         return self
@@ -399,7 +512,7 @@ class Query:
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         if not isinstance(subquery, Query):
             raise TypeError(f"subquery must be a Query object, got {type(subquery).__name__}")
@@ -423,14 +536,13 @@ class Query:
             ValueError: If element_type is invalid or set_name contains invalid characters.
             TypeError: If element_type or set_name is not a string, or tags is not a list of strings.
         """
-        valid_types = ['node', 'way', 'relation']
-        if element_type not in valid_types:
-            raise ValueError(f"element_type must be one of {valid_types}, got {element_type}")
+        if element_type not in _VALID_ELEMENT_TYPES:
+            raise ValueError(f"element_type must be one of {list(_ELEMENT_TYPES)}, got {element_type}")
         if not isinstance(set_name, str):
             raise TypeError(f"set_name must be a string, got {type(set_name).__name__}")
         if not set_name.strip():
             raise ValueError("set_name cannot be empty or whitespace")
-        if any(char in set_name for char in '[]{}();'):
+        if INVALID_SET_CHARS_RE.search(set_name) is not None:
             raise ValueError(f"set_name contains invalid characters for Overpass QL: {set_name}. Avoid using [], {{}}, (), or ;.")
         if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
             raise TypeError("tags must be a list of strings")
@@ -452,12 +564,8 @@ class Query:
         """
         if not isinstance(raw_statement, str):
             raise TypeError(f"raw_statement must be a string, got {type(raw_statement).__name__}")
-        if not raw_statement.strip():
-            raise ValueError("raw_statement cannot be empty or whitespace")
-        if not raw_statement.strip().endswith(';'):
-            raise ValueError(f"raw_statement must end with a semicolon for valid Overpass QL syntax, got {raw_statement}")
-        self.statements.append(raw_statement)
-        return self
+        _validate_raw_statement(raw_statement)
+        return self._add(raw_statement)
 
     def union_with(self, other: 'Query') -> 'Query':
         """Combine this query with another query using a union operation.
@@ -474,7 +582,9 @@ class Query:
         if not isinstance(other, Query):
             raise TypeError(f"other must be a Query object, got {type(other).__name__}")
         # Extract statements from the other query and add them as a union
-        if other.statements:
+        if len(other.statements) == 1 and isinstance(other.statements[0], Union):
+            self.statements.append(other.statements[0])
+        elif other.statements:
             self.statements.append(Union(tuple(other.statements)))
         return self
 
@@ -500,46 +610,25 @@ class Query:
         # Use the first statement of this query as the base and subtract the other query's statements
         base = self.statements[0]
         subtract = tuple(other.statements)
-        difference = Difference(base, subtract)
-        self.statements = self.statements[1:]  # Remove the base statement
-        self.statements.insert(0, difference)  # Add the difference as the first statement
+        # The base is consumed by the difference, so replace it in place
+        self.statements[0] = Difference(base, subtract)
         return self
 
     def print(self) -> None:
-        """Print the Overpass QL query string to the console."""
-        print(self.__str__())
-
-    def _validate_bbox(self, bbox: TypingTuple[float, float, float, float]) -> None:
-        """Validate the bounding box coordinates.
-
-        Args:
-            bbox (Tuple[float, float, float, float]): The bounding box to validate.
-
-        Raises:
-            TypeError: If bbox is not a tuple or values are not numbers.
-            ValueError: If bbox does not have exactly 4 values or coordinates are invalid.
-        """
-        if not isinstance(bbox, tuple):
-            raise TypeError(f"Expected a tuple for bbox, got {type(bbox).__name__}")
-        if len(bbox) != 4:
-            raise ValueError(f"Bounding box must have exactly 4 values (south, west, north, east), got {len(bbox)} values: {bbox}")
-        for i, value in enumerate(bbox):
-            if not isinstance(value, (float, int)):
-                raise TypeError(f"Element {i} of bbox must be a float or int, got {value} of type {type(value).__name__}")
-        min_lat, min_lon, max_lat, max_lon = bbox
-        if not (-90 <= min_lat <= max_lat <= 90):
-            raise ValueError(f"Latitude must be between -90 and 90, with min_lat <= max_lat, got min_lat={min_lat}, max_lat={max_lat}")
-        if not (-180 <= min_lon <= max_lon <= 180):
-            raise ValueError(f"Longitude must be between -180 and 180, with min_lon <= max_lon, got min_lon={min_lon}, max_lon={max_lon}")
+        """Print the Overpass QL query string to the console, writing it line by line."""
+        sys.stdout.writelines(f"{line}\n" for line in self._iter_lines())
 
     def _validate_query(self) -> None:
         """Validate the query for common Overpass QL syntax errors.
 
         Raises:
-            ValueError: If the query has invalid output mode combinations.
+            ValueError: If output_detail is not a valid option, or the query has invalid output mode combinations.
         """
+        # output_detail can be assigned directly, so check it before it is used to look up the output prefix
+        if self.output_detail is not None and self.output_detail not in _VALID_OUTPUT_DETAILS:
+            raise ValueError(f"Invalid output_detail, must be one of {list(_OUTPUT_DETAILS)}, got {self.output_detail}")
         # Check for invalid output mode combinations
-        if self.output_mode in ['count', 'ids']:
+        if self.output_mode in _VALID_OUTPUT_MODES:
             if self.sort_order:
                 raise ValueError(f"Cannot use sort_order with output_mode '{self.output_mode}'. Sort order (qt, asc, desc) is not supported with count or ids output modes.")
             if self.limit:
@@ -556,30 +645,26 @@ class Query:
         Returns:
             List[str]: A list of element statements.
         """
-        subquery_lines = str(subquery).split('\n')
-        element_lines = []
-        for line in subquery_lines:
-            # Skip global settings (e.g., "[out:json];") and output (e.g., "out body;")
-            if line.startswith('[') or line.startswith('out '):
-                continue
-            if line.strip():  # Skip empty lines
-                element_lines.append(line.rstrip(';'))
-        return element_lines
+        # Skip empty lines, global settings (e.g., "[out:json];") and output (e.g., "out body;")
+        return [
+            line.rstrip(';')
+            for line in str(subquery).splitlines()
+            if line.strip() and line[0] != '[' and not line.startswith('out ')
+        ]
 
-    def __str__(self) -> str:
-        """Generate the Overpass QL query string for this Query object.
+    def _iter_lines(self) -> Iterator[str]:
+        """Yield the lines of the Overpass QL query string for this Query object.
 
-        Returns:
-            str: The Overpass QL query string.
+        Yields:
+            str: One line of the Overpass QL query string, without a trailing newline.
 
         Raises:
             ValueError: If the query is invalid (e.g., no statements, invalid output mode combinations).
         """
-        # Validate the query before generating the string
+        # Validate the query before generating any lines
         self._validate_query()
 
-        # Build the Overpass QL query string
-        query_lines = []
+        emitted = False
 
         # Add global settings
         settings = []
@@ -590,73 +675,93 @@ class Query:
         if self.date is not None:
             settings.append(f'date:"{self.date}"')
         if self.global_bbox:
-            bbox_str = ",".join(map(str, self.global_bbox))
-            settings.append(f"bbox:{bbox_str}")
+            min_lat, min_lon, max_lat, max_lon = self.global_bbox
+            settings.append(f"bbox:{min_lat},{min_lon},{max_lat},{max_lon}")
         for key, value in self.settings.items():
-            if key in ["date", "timeout", "bbox", "out"]:  # Avoid duplicates
+            if key in _RESERVED_SETTINGS:  # Avoid duplicates
                 continue
-            if key in ["date", "diff"]:
-                settings.append(f'{key}:"{value}"')
-            else:
-                settings.append(f"{key}:{value}")
+            settings.append(f'{key}:"{value}"' if key in _QUOTED_SETTINGS else f"{key}:{value}")
         if settings:
-            query_lines.append(f"[{' '.join(settings)}];")
+            emitted = True
+            yield f"[{' '.join(settings)}];"
 
         # Add is_in statements
-        for lat, lon, set_name in self.is_in_statements:
-            line = f"is_in({lat},{lon})"
-            if set_name:
-                line += f"->.{set_name}"
-            query_lines.append(f"{line};")
+        if self.is_in_statements:
+            emitted = True
+            yield from (
+                f"is_in({lat},{lon})->.{set_name};" if set_name else f"is_in({lat},{lon});"
+                for lat, lon, set_name in self.is_in_statements
+            )
 
         # Add all statements (elements, temporal, and raw) in order of addition
-        for statement in self.statements:
-            statement_str = str(statement)
-            if statement_str.endswith(';'):
-                statement_str = statement_str[:-1]
-            query_lines.append(f"{statement_str};")
+        if self.statements:
+            emitted = True
+            yield from map(_render_terminated, self.statements)
 
         # Add foreach statements
         for set_name, subquery in self.foreach_statements:
             subquery_elements = self._get_subquery_elements(subquery)
             if not subquery_elements:
                 continue  # Skip empty subqueries
-            query_lines.append(f".{set_name} foreach {{")
-            for line in subquery_elements:
-                query_lines.append(f"  {line};")
-            query_lines.append("};")
+            emitted = True
+            yield f".{set_name} foreach {{"
+            yield from (f"  {line};" for line in subquery_elements)
+            yield "};"
 
         # Add convert statements
-        for element_type, set_name, tags in self.convert_statements:
-            tags_str = ", ".join(tags)
-            line = f"convert {element_type} {tags_str}"
-            if set_name:
-                line += f"->.{set_name}"
-            query_lines.append(f"{line};")
+        if self.convert_statements:
+            emitted = True
+            yield from (
+                f"convert {element_type} {', '.join(tags)}->.{set_name};" if set_name
+                else f"convert {element_type} {', '.join(tags)};"
+                for element_type, set_name, tags in self.convert_statements
+            )
 
         # Add output statement with modifiers
         if self.output_mode == 'count':
-            query_lines.append("out count;")
+            yield "out count;"
         elif self.output_mode == 'ids':
-            query_lines.append("out ids;")
+            yield "out ids;"
         elif self.output_detail is not None:
-            out_parts = [f"out {self.output_detail}"]
-            if self.sort_order:
-                out_parts.append(self.sort_order)
-            if self.limit is not None:
-                out_parts.append(str(self.limit))
-            query_lines.append(f"{' '.join(out_parts)};")
+            sort = f" {self.sort_order}" if self.sort_order else ""
+            limit = f" {self.limit}" if self.limit is not None else ""
+            yield f"{_OUT_PREFIXES[self.output_detail]}{sort}{limit};"
+        elif not emitted:
+            # If nothing was added, yield a minimal query with just the settings and output
+            yield "[out:json];"
+            yield "out body;"
 
-        # If no statements were added, return a minimal query with just the settings and output
-        if not query_lines:
-            query_lines.append("[out:json];")
-            query_lines.append("out body;")
+    def __str__(self) -> str:
+        """Generate the Overpass QL query string for this Query object.
 
-        return "\n".join(query_lines)
+        Returns:
+            str: The Overpass QL query string.
+
+        Raises:
+            ValueError: If the query is invalid (e.g., no statements, invalid output mode combinations).
+        """
+        return "\n".join(self._iter_lines())
 
 class Union:
+    __slots__ = ('elements',)
+
     def __init__(self, elements: TypingTuple[TypingUnion[Node, Way, Relation, Changeset, Area], ...]):
-        self.elements = elements
+        # Splice nested unions in place, since '(a; (b; c;););' is equivalent to '(a; b; c;);'
+        flat = []
+        for element in elements:
+            if isinstance(element, Union):
+                flat.extend(element.elements)
+            else:
+                flat.append(element)
+        self.elements = tuple(flat)
+
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Union object, without the trailing semicolon.
+
+        Returns:
+            str: The Overpass QL statement.
+        """
+        return f"({' '.join([_render_terminated(element) for element in self.elements])})"
 
     def __str__(self) -> str:
         """Generate the Overpass QL query string for this Union object.
@@ -664,21 +769,32 @@ class Union:
         Returns:
             str: The Overpass QL query string.
         """
-        element_strs = [str(element).rstrip(';') for element in self.elements]
-        return f"({' '.join(f'{s};' for s in element_strs)});"
+        return self._render_bare() + ";"
 
 class Difference:
+    __slots__ = ('base', 'subtract')
+
     def __init__(self, base: TypingUnion[Node, Way, Relation, Changeset, Area], subtract: TypingTuple[TypingUnion[Node, Way, Relation, Changeset, Area], ...]):
         self.base = base
         self.subtract = subtract
 
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Difference object, without the trailing semicolon.
+
+        Returns:
+            str: The Overpass QL statement.
+        """
+        subtract_part = ' '.join([f'- {_render_terminated(element)}' for element in self.subtract])
+        return f"({_render_terminated(self.base)} {subtract_part})"
+
     def __str__(self) -> str:
         """Generate the Overpass QL query string for this Difference object.
 
         Returns:
             str: The Overpass QL query string.
         """
-        base_str = str(self.base).rstrip(';')
-        subtract_strs = [str(element).rstrip(';') for element in self.subtract]
-        subtract_part = ' '.join(f'- {s};' for s in subtract_strs)
-        return f"({base_str}; {subtract_part});"
\ No newline at end of file
+        return self._render_bare() + ";"
+
+# Statement classes accepted by add_many; exact instances render via _render_bare() plus the ';'
+_STATEMENT_CLASSES = (Node, Way, Relation, Changeset, Area, Union, Difference, Adiff, Timeline, Diff, Recurse)
+_BARE_RENDER_TYPES = frozenset(_STATEMENT_CLASSES)
\ No newline at end of file
@@ -0,0 +1,7 @@
+from typing import Optional, Union
+
+def _format_time(time: Optional[Union[str, int]]) -> str:
+    """Format a timestamp (quoted) or version number for use in an adiff or diff statement."""
+    if time is None:
+        return ""
+    return f'"{time}"' if isinstance(time, str) else str(time)
@@ -1,6 +1,10 @@
 from typing import Optional, Union
+from op_query_builder._validators import ISO8601_RE
+from op_query_builder.temporal._time import _format_time
 
 class Diff:
+    __slots__ = ('start_time', 'end_time')
+
     def __init__(self, start_time: Optional[Union[str, int]] = None, end_time: Optional[Union[str, int]] = None) -> None:
         """Initialize a Diff statement for non-augmented diff queries in Overpass QL.
 
@@ -29,22 +33,25 @@ class Diff:
             if time is None:
                 continue
             if isinstance(time, str):
-                if 'T' not in time or 'Z' not in time:
+                if ISO8601_RE.search(time) is None:
                     raise ValueError(f"Timestamps must be in ISO 8601 format, e.g., '2023-01-01T00:00:00Z', got {time}")
             elif not isinstance(time, int):
                 raise TypeError(f"Time must be a string (ISO 8601) or an integer (version), got {time} of type {type(time).__name__}")
 
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Diff statement, without the trailing semicolon.
+
+        Returns:
+            str: The Overpass QL statement.
+        """
+        start = _format_time(self.start_time)
+        end = _format_time(self.end_time)
+        return f"diff({start},{end})"
+
     def __str__(self) -> str:
         """Generate the Overpass QL query string for this Diff statement.
 
         Returns:
             str: The Overpass QL query string.
         """
-        def format_time(time: Optional[Union[str, int]]) -> str:
-            if time is None:
-                return ""
-            return f'"{time}"' if isinstance(time, str) else str(time)
-
-        start = format_time(self.start_time)
-        end = format_time(self.end_time)
-        return f"diff({start},{end});"
\ No newline at end of file
+        return self._render_bare() + ";"
\ No newline at end of file
@@ -1,6 +1,12 @@
 from typing import Optional
+from op_query_builder._validators import INVALID_SET_CHARS_RE
+
+_DIRECTIONS = ('>>', '<<')
+_VALID_DIRECTIONS = frozenset(_DIRECTIONS)
 
 class Recurse:
+    __slots__ = ('direction', 'set_name')
+
     def __init__(self, direction: str, set_name: Optional[str] = None) -> None:
         """Initialize a Recurse statement for deep recursion in Overpass QL (e.g., '>>' or '<<').
 
@@ -23,23 +29,30 @@ class Recurse:
             ValueError: If direction is invalid, or if set_name is empty or contains invalid characters.
             TypeError: If set_name is not a string.
         """
-        valid_directions = ['>>', '<<']
-        if self.direction not in valid_directions:
-            raise ValueError(f"Direction must be one of {valid_directions}, got {self.direction}")
+        if self.direction not in _VALID_DIRECTIONS:
+            raise ValueError(f"Direction must be one of {list(_DIRECTIONS)}, got {self.direction}")
         if self.set_name is not None:
             if not isinstance(self.set_name, str):
                 raise TypeError(f"set_name must be a string, got {type(self.set_name).__name__}")
             if not self.set_name.strip():
                 raise ValueError("set_name cannot be empty or whitespace")
-            if any(char in self.set_name for char in '[]{}();'):
+            if INVALID_SET_CHARS_RE.search(self.set_name) is not None:
                 raise ValueError(f"set_name contains invalid characters for Overpass QL: {self.set_name}. Avoid using [], {{}}, (), or ;.")
 
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Recurse statement, without the trailing semicolon.
+
+        Returns:
+            str: The Overpass QL statement.
+        """
+        if self.set_name:
+            return f".{self.set_name} {self.direction}"
+        return self.direction
+
     def __str__(self) -> str:
         """Generate the Overpass QL query string for this Recurse statement.
 
         Returns:
             str: The Overpass QL query string.
         """
-        if self.set_name:
-            return f".{self.set_name} {self.direction};"
-        return f"{self.direction};"
\ No newline at end of file
+        return self._render_bare() + ";"
\ No newline at end of file
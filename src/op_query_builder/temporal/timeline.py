@@ -3,7 +3,12 @@ from op_query_builder.elements.node import Node
 from op_query_builder.elements.way import Way
 from op_query_builder.elements.relation import Relation
 
+_ELEMENT_CLASSES = (Node, Way, Relation)
+_ELEMENT_TYPES = frozenset(_ELEMENT_CLASSES)
+
 class Timeline:
+    __slots__ = ('element',)
+
     def __init__(self, element: Union[Node, Way, Relation]) -> None:
         """Initialize a Timeline statement for querying the history of an element in Overpass QL.
 
@@ -22,16 +27,25 @@ class Timeline:
         Raises:
             TypeError: If element is not a Node, Way, or Relation.
         """
-        if not isinstance(self.element, (Node, Way, Relation)):
+        # Exact classes hit the set lookup; subclasses fall through to isinstance
+        if type(self.element) not in _ELEMENT_TYPES and not isinstance(self.element, _ELEMENT_CLASSES):
             raise TypeError(f"Element must be a Node, Way, or Relation, got {type(self.element).__name__}")
 
-    def __str__(self) -> str:
-        """Generate the Overpass QL query string for this Timeline statement.
+    def _render_bare(self) -> str:
+        """Generate the Overpass QL statement for this Timeline statement, without the trailing semicolon.
 
         Returns:
-            str: The Overpass QL query string.
+            str: The Overpass QL statement.
         """
         element_str = str(self.element)
         if element_str.endswith(';'):
             element_str = element_str[:-1]
-        return f"timeline({element_str});"
\ No newline at end of file
+        return f"timeline({element_str})"
+
+    def __str__(self) -> str:
+        """Generate the Overpass QL query string for this Timeline statement.
+
+        Returns:
+            str: The Overpass QL query string.
+        """
+        return self._render_bare() + ";"
\ No newline at end of file
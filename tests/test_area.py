@@ -14,15 +14,10 @@ class TestArea(unittest.TestCase):
 
     def test_complex_query(self):
         area = self.area
-        print("After init:", area)
         area = area.from_set("input")
-        print("After from_set:", area)
         area = area.with_id(3600000000)
-        print("After with_id:", area)
         area = area.with_tags([("boundary", "administrative")])
-        print("After with_tags:", area)
         area = area.store_as_set("output")
-        print("After store_as_set:", area)
         self.assertEqual(str(area), ".input area(3600000000)[boundary=administrative]->.output;")
 
     def test_with_id(self):
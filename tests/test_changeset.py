@@ -14,17 +14,11 @@ class TestChangeset(unittest.TestCase):
 
     def test_complex_query(self):
         changeset = self.changeset
-        print("After init:", changeset)
         changeset = changeset.from_set("input")
-        print("After from_set:", changeset)
         changeset = changeset.with_id(123)
-        print("After with_id:", changeset)
         changeset = changeset.with_user("JohnDoe")
-        print("After with_user:", changeset)
         changeset = changeset.with_open(True)
-        print("After with_open:", changeset)
         changeset = changeset.store_as_set("output")
-        print("After store_as_set:", changeset)
         self.assertEqual(str(changeset), ".input changeset(123)[user=JohnDoe][open=true]->.output;")
 
     def test_with_user_alone(self):
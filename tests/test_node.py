@@ -199,6 +199,8 @@ class TestNode(unittest.TestCase):
         self.assertEqual(str(node), 'node[newer="2023-01-01T00:00:00Z"];')
         with self.assertRaises(ValueError):
             Node().with_newer("2023-01-01")  # Missing T and Z
+        with self.assertRaises(ValueError):
+            Node().with_newer("2023-01-01Z00T")  # Z before T
 
     def test_with_version(self):
         node = Node().with_version(2)
@@ -1,4 +1,6 @@
+import io
 import unittest
+from contextlib import redirect_stdout
 from op_query_builder.query import Query
 from op_query_builder.elements.node import Node
 from op_query_builder.elements.way import Way
@@ -46,6 +48,10 @@ class TestQuery(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.query.with_date("2023-01-01")  # Missing 'T' and 'Z'
 
+    def test_with_date_z_before_t(self):
+        with self.assertRaises(ValueError):
+            self.query.with_date("2023-01-01Z00T")  # 'Z' must follow 'T'
+
     def test_with_global_bbox(self):
         self.query.with_global_bbox((51.0, -0.2, 51.1, -0.1))
         way = Way().with_tags([("highway", "primary")])
@@ -60,6 +66,12 @@ class TestQuery(unittest.TestCase):
         expected = "[out:json];\nway[highway=primary];\nout geom;"
         self.assertEqual(str(self.query), expected)
 
+    def test_output_detail_assigned_invalid(self):
+        self.query.add_way(Way().with_tags([("highway", "primary")]))
+        self.query.output_detail = "everything"
+        with self.assertRaises(ValueError):
+            str(self.query)
+
     def test_with_sort_order(self):
         self.query.with_sort_order("qt")
         way = Way().with_tags([("highway", "primary")])
@@ -122,6 +134,22 @@ class TestQuery(unittest.TestCase):
         expected = "[out:json];\ntimeline(node(123));\nout body;"
         self.assertEqual(str(self.query), expected)
 
+    def test_timeline_uses_element_str(self):
+        class CustomNode(Node):
+            def __str__(self):
+                return "node(id:123);"
+        timeline = Timeline(CustomNode().with_id(123))
+        self.assertEqual(str(timeline), "timeline(node(id:123));")
+
+    def test_query_uses_element_str(self):
+        class CustomNode(Node):
+            def __str__(self):
+                return "node(1)[custom];"
+        self.query.add_node(CustomNode().with_id(1))
+        self.query.add_union(CustomNode().with_id(1), Way().with_id(2))
+        expected = "[out:json];\nnode(1)[custom];\n(node(1)[custom]; way(2););\nout body;"
+        self.assertEqual(str(self.query), expected)
+
     def test_add_diff(self):
         diff = Diff("2023-01-01T00:00:00Z", "2023-12-31T23:59:59Z")
         self.query.add_diff(diff)
@@ -156,6 +184,24 @@ class TestQuery(unittest.TestCase):
         expected = '[out:json];\nrelation[type=boundary];\n>>;\nout body;'
         self.assertEqual(str(self.query), expected)
 
+    def test_add_many(self):
+        node = Node().with_id(123)
+        way = Way().with_tags([("highway", "primary")])
+        recurse = Recurse(">>")
+        self.query.add_many([node, way, recurse])
+        expected = "[out:json];\nnode(123);\nway[highway=primary];\n>>;\nout body;"
+        self.assertEqual(str(self.query), expected)
+
+    def test_add_many_invalid_raw_statement(self):
+        with self.assertRaises(ValueError):
+            self.query.add_many([Node().with_id(1), "node(2)"])  # Missing semicolon
+        self.assertEqual(self.query.statements, [])
+
+    def test_add_many_invalid_type(self):
+        with self.assertRaises(TypeError):
+            self.query.add_many([Node().with_id(1), object()])
+        self.assertEqual(self.query.statements, [])
+
     def test_add_changeset(self):
         changeset = Changeset().with_user("JohnDoe")
         self.query.add_changeset(changeset)
@@ -173,6 +219,16 @@ class TestQuery(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.query.add_union()
 
+    def test_union_with_flattens_nested_union(self):
+        way1 = Way().with_tags([("highway", "primary")])
+        way2 = Way().with_tags([("highway", "secondary")])
+        node = Node().with_tags([("amenity", "cafe")])
+        other = Query().add_union(way1, way2)
+        self.query.union_with(other)
+        self.query.add_union(self.query.statements[0], node)
+        expected = "[out:json];\n(way[highway=primary]; way[highway=secondary];);\n(way[highway=primary]; way[highway=secondary]; node[amenity=cafe];);\nout body;"
+        self.assertEqual(str(self.query), expected)
+
     def test_add_difference(self):
         way1 = Way().with_tags([("highway", "primary")])
         way2 = Way().with_tags([("highway", "secondary")])
@@ -180,6 +236,15 @@ class TestQuery(unittest.TestCase):
         expected = "[out:json];\n(way[highway=primary]; - way[highway=secondary];);\nout body;"
         self.assertEqual(str(self.query), expected)
 
+    def test_difference_with(self):
+        way1 = Way().with_tags([("highway", "primary")])
+        node = Node().with_tags([("amenity", "cafe")])
+        way2 = Way().with_tags([("highway", "secondary")])
+        self.query.add_way(way1).add_node(node)
+        self.query.difference_with(Query().add_way(way2))
+        expected = "[out:json];\n(way[highway=primary]; - way[highway=secondary];);\nnode[amenity=cafe];\nout body;"
+        self.assertEqual(str(self.query), expected)
+
     def test_add_difference_empty_subtract(self):
         way1 = Way().with_tags([("highway", "primary")])
         with self.assertRaises(ValueError):
@@ -212,5 +277,13 @@ class TestQuery(unittest.TestCase):
         expected = "[out:json];\nconvert node ::id=way.id, highway=way.highway->.converted_nodes;\nout body;"
         self.assertEqual(str(self.query), expected)
 
+    def test_print(self):
+        way = Way().with_tags([("highway", "primary")])
+        self.query.with_timeout(60).add_way(way)
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            self.query.print()
+        self.assertEqual(buffer.getvalue(), str(self.query) + "\n")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch, PropertyMock
+from unittest.mock import patch, Mock
 import overpy
 from op_query_builder.query import Query
 from op_query_builder.elements.way import Way
@@ -98,20 +98,18 @@ class TestQueryClient(unittest.TestCase):
     def test_get_admin_level(self):
         # Mock a result with a relation
         mock_relation = overpy.Relation(attributes={"id": 123}, tags={"boundary": "administrative", "admin_level": "2"})
-        mock_result = overpy.Result()
-        with patch('overpy.Result.relations', new_callable=PropertyMock, return_value=[mock_relation]):
-            with patch.object(overpy.Overpass, 'query', return_value=mock_result):
-                result = self.client.get_admin_level(51.5, -0.1, admin_level=2)
-                self.assertIsNotNone(result)
-                self.assertEqual(result.attributes["id"], 123)
-                self.assertEqual(result.tags["admin_level"], "2")
+        mock_result = Mock(relations=[mock_relation])
+        with patch.object(overpy.Overpass, 'query', return_value=mock_result):
+            result = self.client.get_admin_level(51.5, -0.1, admin_level=2)
+            self.assertIsNotNone(result)
+            self.assertEqual(result.attributes["id"], 123)
+            self.assertEqual(result.tags["admin_level"], "2")
 
     def test_get_admin_level_not_found(self):
-        mock_result = overpy.Result()
-        with patch('overpy.Result.relations', new_callable=PropertyMock, return_value=[]):
-            with patch.object(overpy.Overpass, 'query', return_value=mock_result):
-                result = self.client.get_admin_level(51.5, -0.1)
-                self.assertIsNone(result)
+        mock_result = Mock(relations=[])
+        with patch.object(overpy.Overpass, 'query', return_value=mock_result):
+            result = self.client.get_admin_level(51.5, -0.1)
+            self.assertIsNone(result)
 
     def test_clear_cache(self):
         query = Query()
@@ -14,17 +14,11 @@ class TestRelation(unittest.TestCase):
 
     def test_complex_query(self):
         relation = self.relation
-        print("After init:", relation)
         relation = relation.from_set("input")
-        print("After from_set:", relation)
         relation = relation.with_id(123)
-        print("After with_id:", relation)
         relation = relation.with_tags([("boundary", "administrative")])
-        print("After with_tags:", relation)
         relation = relation.with_user("JohnDoe")
-        print("After with_user:", relation)
         relation = relation.store_as_set("output")
-        print("After store_as_set:", relation)
         self.assertEqual(str(relation), ".input relation(123)[boundary=administrative][user=JohnDoe]->.output;")
 
     def test_with_user_alone(self):
@@ -14,17 +14,11 @@ class TestWay(unittest.TestCase):
 
     def test_complex_query(self):
         way = self.way
-        print("After init:", way)
         way = way.from_set("input")
-        print("After from_set:", way)
         way = way.with_id(123)
-        print("After with_id:", way)
         way = way.with_tags([("highway", "primary")])
-        print("After with_tags:", way)
         way = way.with_user("JohnDoe")
-        print("After with_user:", way)
         way = way.store_as_set("output")
-        print("After store_as_set:", way)
         self.assertEqual(str(way), ".input way(123)[highway=primary][user=JohnDoe]->.output;")
 
     def test_with_user_alone(self):
@@ -51,10 +45,14 @@ class TestWay(unittest.TestCase):
             way.with_id(3)
 
     def test_with_ids(self):
-        for ids in [[1, 2, 3], [10, 20], [100]]:
+        cases = (
+            ([1, 2, 3], "way(1,2,3);"),
+            ([10, 20], "way(10,20);"),
+            ([100], "way(100);"),
+        )
+        for ids, expected in cases:
             with self.subTest(ids=ids):
                 way = self.way.with_ids(ids)
-                expected = f"way({','.join(map(str, ids))});"
                 self.assertEqual(str(way), expected)
 
     def test_with_ids_invalid_type(self):
@@ -185,12 +183,15 @@ class TestWay(unittest.TestCase):
     def test_with_tag_condition(self):
         way = self.way.with_tag_condition('["highway"~"primary"]')
         self.assertEqual(str(way), 'way["highway"~"primary"];')
-        with self.assertRaises(ValueError):
-            way.with_tag_condition("invalid")  # Missing brackets
-        with self.assertRaises(ValueError):
-            way.with_tag_condition('["key"=value]')  # Unquoted value
-        with self.assertRaises(ValueError):
-            way.with_tag_condition('["key"]')  # Missing operator
+        invalid_conditions = (
+            "invalid",  # Missing brackets
+            '["key"=value]',  # Unquoted value
+            '["key"]',  # Missing operator
+        )
+        for condition in invalid_conditions:
+            with self.subTest(condition=condition):
+                with self.assertRaises(ValueError):
+                    way.with_tag_condition(condition)
 
     def test_with_if_condition(self):
         way = self.way.with_if_condition('length() > 1000')